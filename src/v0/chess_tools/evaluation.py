@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import queue
 import shutil
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,7 +17,9 @@ import chess.engine
 from .moves import _parse_pgn_to_board
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Hashable, Iterable, Iterator, Mapping
+    from types import TracebackType
+    from typing import Self
 
 # Default Stockfish paths to search
 _DEFAULT_STOCKFISH_PATHS = [
@@ -23,8 +29,17 @@ _DEFAULT_STOCKFISH_PATHS = [
     "stockfish",  # Rely on PATH
 ]
 
+# Cached evaluations keyed by (engine configuration, EPD i.e. position without
+# move clocks, multipv, nodes). Values are (requested depth, result) so deeper
+# entries can serve shallower requests.
+_EVAL_CACHE: dict[
+    tuple[tuple[Hashable, ...], str, int, int | None], tuple[int, EvaluationResult | MultiPVResult]
+] = {}
+_EVAL_CACHE_LOCK = threading.Lock()
+_EVAL_CACHE_MAXSIZE = 65536
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EvaluationResult:
     """Result of a Stockfish position evaluation."""
 
@@ -67,7 +82,7 @@ class EvaluationResult:
         return "?"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MultiPVResult:
     """Result containing multiple principal variations."""
 
@@ -78,10 +93,14 @@ class MultiPVResult:
     """FEN of the evaluated position."""
 
 
+@functools.cache
 def find_stockfish() -> str | None:
     """
     Attempt to find the Stockfish binary.
 
+    The result is cached for the life of the process; call
+    invalidate_stockfish_cache() to search again.
+
     Returns:
         Path to Stockfish if found, None otherwise.
     """
@@ -98,25 +117,205 @@ def find_stockfish() -> str | None:
     return None
 
 
+def invalidate_stockfish_cache() -> None:
+    """Forget the cached find_stockfish() result, e.g. after installing Stockfish."""
+    find_stockfish.cache_clear()
+
+
+class StockfishPool:
+    """
+    A set of running Stockfish processes reused across many evaluations.
+
+    Starting Stockfish (process spawn, UCI handshake, network load) costs far
+    more than a shallow search, so batch workloads should open a pool once and
+    pass it to the evaluation functions. Each engine is configured exactly once
+    when the pool is opened.
+
+    By default ``ucinewgame`` is sent before every position, which clears the
+    engine's hash table so results do not depend on evaluation order. With
+    ``reuse_hash=True`` it is skipped, so related positions (e.g. sibling
+    lines of a tree) benefit from entries left by earlier searches; the
+    speedup grows as the table fills, at the cost of order-dependent results.
+
+    Engines are handed out through a queue, so a pool with ``workers > 1`` can
+    be shared by several threads.
+
+    Example:
+        >>> with StockfishPool(workers=2) as pool:
+        ...     result = evaluate_fen(chess.STARTING_FEN, depth=12, pool=pool)
+    """
+
+    def __init__(
+        self,
+        stockfish_path: str | None = None,
+        *,
+        workers: int = 1,
+        threads: int = 1,
+        hash_mb: int = 256,
+        reuse_hash: bool = False,
+        options: Mapping[str, chess.engine.ConfigValue] | None = None,
+    ) -> None:
+        """
+        Args:
+            stockfish_path: Path to Stockfish binary. If None, attempts auto-detection.
+            workers: Number of Stockfish processes to start.
+            threads: Number of CPU threads for each Stockfish process.
+            hash_mb: Hash table size in megabytes for each Stockfish process.
+            reuse_hash: Keep each engine's hash table between positions
+                instead of sending ``ucinewgame``.
+            options: Additional UCI options, e.g. ``{"Use NNUE": False}``.
+                Options the engine does not advertise are skipped, since
+                the available set differs between Stockfish versions.
+        """
+        self.stockfish_path = stockfish_path
+        self.workers = workers
+        self.threads = threads
+        self.hash_mb = hash_mb
+        self.reuse_hash = reuse_hash
+        self.options = dict(options or {})
+        self._engines: list[chess.engine.SimpleEngine] = []
+        self._idle: queue.Queue[chess.engine.SimpleEngine] = queue.Queue()
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Start and configure the Stockfish processes.
+
+        Raises:
+            FileNotFoundError: If Stockfish binary cannot be found.
+        """
+        stockfish_path = _resolve_stockfish_path(self.stockfish_path)
+        try:
+            for _ in range(self.workers):
+                engine = chess.engine.SimpleEngine.popen_uci(stockfish_path)
+                self._engines.append(engine)
+                config = {
+                    name: value for name, value in self.options.items() if name in engine.options
+                }
+                config.update({"Threads": self.threads, "Hash": self.hash_mb})
+                engine.configure(config)
+                self._idle.put(engine)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Shut down all Stockfish processes."""
+        while self._engines:
+            self._engines.pop().quit()
+        self._idle = queue.Queue()
+
+    def analyse(
+        self,
+        board: chess.Board,
+        *,
+        depth: int = 20,
+        nodes: int | None = None,
+        multipv: int = 1,
+        root_moves: Iterable[chess.Move] | None = None,
+    ) -> EvaluationResult | MultiPVResult:
+        """
+        Evaluate a position on the next idle engine.
+
+        Blocks until an engine is available.
+
+        Args:
+            board: A python-chess Board object to evaluate.
+            depth: Search depth.
+            nodes: Also stop after searching this many nodes (None = no node limit).
+            multipv: Number of principal variations to calculate.
+            root_moves: Restrict the search to these moves (None = all legal moves).
+
+        Returns:
+            EvaluationResult if multipv=1, MultiPVResult if multipv>1.
+
+        Raises:
+            RuntimeError: If the pool has not been opened.
+        """
+        # python-chess sends ucinewgame whenever the game object changes
+        game = self if self.reuse_hash else object()
+
+        with self.borrow() as engine:
+            return _analyse_on(
+                engine,
+                board,
+                depth=depth,
+                nodes=nodes,
+                multipv=multipv,
+                game=game,
+                root_moves=root_moves,
+            )
+
+    @contextlib.contextmanager
+    def borrow(self) -> Iterator[chess.engine.SimpleEngine]:
+        """
+        Take an idle engine for direct use, returning it to the pool afterwards.
+
+        Useful for python-chess features the wrappers do not expose, such as
+        streaming analysis. Blocks until an engine is available.
+
+        Yields:
+            A configured chess.engine.SimpleEngine.
+
+        Raises:
+            RuntimeError: If the pool has not been opened.
+
+        Example:
+            >>> with pool.borrow() as engine:
+            ...     with engine.analysis(board, chess.engine.Limit(depth=15)) as analysis:
+            ...         depths = [info["depth"] for info in analysis if "depth" in info]
+        """
+        if not self._engines:
+            raise RuntimeError("StockfishPool is not open")
+
+        engine = self._idle.get()
+        try:
+            yield engine
+        finally:
+            self._idle.put(engine)
+
+
 def evaluate_position(
     board: chess.Board,
     *,
     depth: int = 20,
+    nodes: int | None = None,
     stockfish_path: str | None = None,
     threads: int = 1,
     hash_mb: int = 256,
     multipv: int = 1,
+    pool: StockfishPool | None = None,
 ) -> EvaluationResult | MultiPVResult:
     """
     Evaluate a chess position using Stockfish.
 
+    The board is temporarily modified while the principal variation is
+    converted to SAN and is restored before returning, so it must not be
+    shared with other threads during the call.
+
     Args:
         board: A python-chess Board object to evaluate.
         depth: Search depth (higher = stronger but slower).
+        nodes: Also stop after searching this many nodes (None = no node limit).
+            With threads=1 a node-limited search is reproducible run to run.
         stockfish_path: Path to Stockfish binary. If None, attempts auto-detection.
         threads: Number of CPU threads for Stockfish to use.
         hash_mb: Hash table size in megabytes.
         multipv: Number of principal variations to calculate (1 = best move only).
+        pool: An open StockfishPool to run the search on. When given,
+            stockfish_path, threads and hash_mb are ignored in favour of the
+            pool's configuration.
 
     Returns:
         EvaluationResult if multipv=1, MultiPVResult if multipv>1.
@@ -131,71 +330,107 @@ def evaluate_position(
         >>> result = evaluate_position(board, depth=15)
         >>> print(f"Eval: {result.evaluation_str}, Best: {result.best_move}")
     """
-    if stockfish_path is None:
-        stockfish_path = find_stockfish()
-        if stockfish_path is None:
-            raise FileNotFoundError(
-                "Stockfish not found. Install it or provide stockfish_path. "
-                "Install via: apt install stockfish (Linux), "
-                "brew install stockfish (macOS), "
-                "or download from https://stockfishchess.org/download/"
-            )
+    if pool is not None:
+        return pool.analyse(board, depth=depth, nodes=nodes, multipv=multipv)
 
-    engine = chess.engine.SimpleEngine.popen_uci(stockfish_path)
+    with StockfishPool(stockfish_path, threads=threads, hash_mb=hash_mb) as own_pool:
+        return own_pool.analyse(board, depth=depth, nodes=nodes, multipv=multipv)
 
-    try:
-        engine.configure({"Threads": threads, "Hash": hash_mb})
 
-        limit = chess.engine.Limit(depth=depth)
+def evaluate_positions(
+    boards: Iterable[chess.Board],
+    *,
+    depth: int = 20,
+    nodes: int | None = None,
+    stockfish_path: str | None = None,
+    threads: int = 1,
+    hash_mb: int = 256,
+    multipv: int = 1,
+    pool: StockfishPool | None = None,
+) -> Iterator[EvaluationResult | MultiPVResult]:
+    """
+    Evaluate many positions, reusing one Stockfish process for all of them.
 
-        if multipv == 1:
-            info = engine.analyse(board, limit)
-            return _parse_single_result(board, info)
-        else:
-            infos = engine.analyse(board, limit, multipv=multipv)
-            results = tuple(_parse_single_result(board, info) for info in infos)
-            return MultiPVResult(lines=results, fen=board.fen())
+    Results are yielded lazily and in the same order as ``boards``.
 
-    finally:
-        engine.quit()
+    Args:
+        boards: Positions to evaluate.
+        depth: Search depth.
+        nodes: Also stop after searching this many nodes (None = no node limit).
+        stockfish_path: Path to Stockfish binary (ignored if pool is given).
+        threads: Number of CPU threads (ignored if pool is given).
+        hash_mb: Hash table size in MB (ignored if pool is given).
+        multipv: Number of principal variations.
+        pool: An open StockfishPool to use. If None, a single-engine pool is
+            opened for the duration of the iteration.
+
+    Yields:
+        EvaluationResult if multipv=1, MultiPVResult if multipv>1.
+
+    Example:
+        >>> boards = [chess.Board(), chess.Board(chess.STARTING_FEN)]
+        >>> [r.evaluation_str for r in evaluate_positions(boards, depth=10)]
+    """
+    if pool is not None:
+        for board in boards:
+            yield pool.analyse(board, depth=depth, nodes=nodes, multipv=multipv)
+        return
+
+    with StockfishPool(stockfish_path, threads=threads, hash_mb=hash_mb) as own_pool:
+        for board in boards:
+            yield own_pool.analyse(board, depth=depth, nodes=nodes, multipv=multipv)
 
 
 def evaluate_fen(
     fen: str,
     *,
     depth: int = 20,
+    nodes: int | None = None,
     stockfish_path: str | None = None,
     threads: int = 1,
     hash_mb: int = 256,
     multipv: int = 1,
+    pool: StockfishPool | None = None,
+    use_cache: bool = True,
 ) -> EvaluationResult | MultiPVResult:
     """
     Evaluate a position specified by FEN string.
 
     Args:
-        fen: FEN string representing the position.
+        fen: FEN string representing the position. The halfmove and fullmove
+            clocks may be omitted (EPD-style), in which case they default to 0 and 1.
         depth: Search depth.
+        nodes: Also stop after searching this many nodes (None = no node limit).
         stockfish_path: Path to Stockfish binary.
         threads: Number of CPU threads.
         hash_mb: Hash table size in MB.
         multipv: Number of principal variations.
+        pool: An open StockfishPool to use instead of spawning Stockfish.
+        use_cache: Read and store the result in the evaluation cache.
 
     Returns:
         EvaluationResult if multipv=1, MultiPVResult if multipv>1.
 
+    Results are cached per engine configuration and position, ignoring the
+    halfmove and fullmove clocks, so transpositions are only searched once.
+    A cached result from a search at least as deep as the requested one is
+    reused. Use clear_eval_cache() to discard cached results.
+
     Example:
         >>> result = evaluate_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
         >>> result.best_move
         'e5'
     """
-    board = chess.Board(fen)
-    return evaluate_position(
-        board,
+    return _evaluate_board_core(
+        chess.Board(fen),
         depth=depth,
+        nodes=nodes,
         stockfish_path=stockfish_path,
         threads=threads,
         hash_mb=hash_mb,
         multipv=multipv,
+        pool=pool,
+        use_cache=use_cache,
     )
 
 
@@ -203,10 +438,13 @@ def evaluate_pgn(
     pgn: str,
     *,
     depth: int = 20,
+    nodes: int | None = None,
     stockfish_path: str | None = None,
     threads: int = 1,
     hash_mb: int = 256,
     multipv: int = 1,
+    pool: StockfishPool | None = None,
+    use_cache: bool = True,
 ) -> EvaluationResult | MultiPVResult:
     """
     Evaluate the final position of a PGN game.
@@ -214,31 +452,188 @@ def evaluate_pgn(
     Args:
         pgn: PGN string (full PGN or bare move sequence).
         depth: Search depth.
+        nodes: Also stop after searching this many nodes (None = no node limit).
         stockfish_path: Path to Stockfish binary.
         threads: Number of CPU threads.
         hash_mb: Hash table size in MB.
         multipv: Number of principal variations.
+        pool: An open StockfishPool to use instead of spawning Stockfish.
+        use_cache: Read and store the result in the evaluation cache.
 
     Returns:
         EvaluationResult if multipv=1, MultiPVResult if multipv>1.
 
+    Results are cached like evaluate_fen's, and the parsed game of each
+    recently seen PGN string is remembered so repeated calls skip parsing.
+    The engine still receives the full move history, which it uses to
+    detect repetitions.
+
     Example:
         >>> result = evaluate_pgn("1. e4 e5 2. Nf3 Nc6 3. Bb5")
         >>> print(f"Ruy Lopez eval: {result.evaluation_str}")
     """
-    board = _parse_pgn_to_board(pgn)
-    return evaluate_position(
+    # Copy so the cached board's move stack is never shared with the engine call
+    board = _pgn_final_board(pgn).copy()
+    return _evaluate_board_core(
+        board,
+        depth=depth,
+        nodes=nodes,
+        stockfish_path=stockfish_path,
+        threads=threads,
+        hash_mb=hash_mb,
+        multipv=multipv,
+        pool=pool,
+        use_cache=use_cache,
+    )
+
+
+def clear_eval_cache() -> None:
+    """Discard all cached evaluation results."""
+    with _EVAL_CACHE_LOCK:
+        _EVAL_CACHE.clear()
+
+
+def _evaluate_board_core(
+    board: chess.Board,
+    *,
+    depth: int = 20,
+    nodes: int | None = None,
+    stockfish_path: str | None = None,
+    threads: int = 1,
+    hash_mb: int = 256,
+    multipv: int = 1,
+    pool: StockfishPool | None = None,
+    use_cache: bool = True,
+) -> EvaluationResult | MultiPVResult:
+    """Evaluate a board through the evaluation cache (see evaluate_fen)."""
+    if not use_cache:
+        return evaluate_position(
+            board,
+            depth=depth,
+            nodes=nodes,
+            stockfish_path=stockfish_path,
+            threads=threads,
+            hash_mb=hash_mb,
+            multipv=multipv,
+            pool=pool,
+        )
+
+    if pool is not None:
+        config = _engine_config(
+            pool.stockfish_path,
+            threads=pool.threads,
+            hash_mb=pool.hash_mb,
+            reuse_hash=pool.reuse_hash,
+            options=pool.options,
+        )
+    else:
+        config = _engine_config(stockfish_path, threads=threads, hash_mb=hash_mb)
+    key = (config, board.epd(), multipv, nodes)
+
+    with _EVAL_CACHE_LOCK:
+        cached = _EVAL_CACHE.get(key)
+    if cached is not None and cached[0] >= depth:
+        result = cached[1]
+        if isinstance(result, MultiPVResult):
+            # The entry may come from a transposition with different clocks
+            fen = board.fen()
+            if result.fen != fen:
+                result = MultiPVResult(lines=result.lines, fen=fen)
+        return result
+
+    result = evaluate_position(
         board,
         depth=depth,
+        nodes=nodes,
         stockfish_path=stockfish_path,
         threads=threads,
         hash_mb=hash_mb,
         multipv=multipv,
+        pool=pool,
     )
 
+    with _EVAL_CACHE_LOCK:
+        cached = _EVAL_CACHE.get(key)
+        if cached is None or cached[0] < depth:
+            if cached is None and len(_EVAL_CACHE) >= _EVAL_CACHE_MAXSIZE:
+                del _EVAL_CACHE[next(iter(_EVAL_CACHE))]
+            _EVAL_CACHE[key] = (depth, result)
+
+    return result
+
+
+def _engine_config(
+    stockfish_path: str | None,
+    *,
+    threads: int,
+    hash_mb: int,
+    reuse_hash: bool = False,
+    options: Mapping[str, chess.engine.ConfigValue] | None = None,
+) -> tuple[Hashable, ...]:
+    """Identify an engine setup, so cached results are only reused by the same setup."""
+    return (
+        _resolve_stockfish_path(stockfish_path),
+        threads,
+        hash_mb,
+        reuse_hash,
+        tuple(sorted((options or {}).items())),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _pgn_final_board(pgn: str) -> chess.Board:
+    """Return the final board of a PGN string, with its move stack.
+
+    Callers must not modify the returned board; copy it first.
+    """
+    return _parse_pgn_to_board(pgn)
+
+
+def _resolve_stockfish_path(stockfish_path: str | None) -> str:
+    """Return stockfish_path, auto-detecting it if None."""
+    if stockfish_path is None:
+        stockfish_path = find_stockfish()
+        if stockfish_path is None:
+            raise FileNotFoundError(
+                "Stockfish not found. Install it or provide stockfish_path. "
+                "Install via: apt install stockfish (Linux), "
+                "brew install stockfish (macOS), "
+                "or download from https://stockfishchess.org/download/"
+            )
+    return stockfish_path
+
+
+def _analyse_on(
+    engine: chess.engine.SimpleEngine,
+    board: chess.Board,
+    *,
+    depth: int,
+    nodes: int | None = None,
+    multipv: int,
+    game: object = None,
+    root_moves: Iterable[chess.Move] | None = None,
+) -> EvaluationResult | MultiPVResult:
+    """Run a single analysis on an already configured engine.
+
+    A ``game`` that differs from the engine's previous one makes python-chess
+    send ``ucinewgame`` before the search.
+    """
+    limit = chess.engine.Limit(depth=depth, nodes=nodes)
+
+    if multipv == 1:
+        info = engine.analyse(board, limit, game=game, root_moves=root_moves)
+        return _parse_single_result(board, info)
+    else:
+        infos = engine.analyse(board, limit, multipv=multipv, game=game, root_moves=root_moves)
+        results = tuple(_parse_single_result(board, info) for info in infos)
+        return MultiPVResult(lines=results, fen=board.fen())
+
 
 def _parse_single_result(board: chess.Board, info: chess.engine.InfoDict) -> EvaluationResult:
-    """Parse engine info dict into EvaluationResult."""
+    """Parse engine info dict into EvaluationResult.
+
+    The board is temporarily modified and restored before returning.
+    """
     score = info["score"].white()
 
     # Extract centipawns or mate score
@@ -254,12 +649,16 @@ def _parse_single_result(board: chess.Board, info: chess.engine.InfoDict) -> Eva
     pv = info.get("pv", [])
     best_move = pv[0] if pv else None
 
-    # Convert PV to SAN
+    # Convert PV to SAN, playing it out on the board itself and undoing it
+    # afterwards rather than copying the board
     pv_san = []
-    temp_board = board.copy()
-    for move in pv:
-        pv_san.append(temp_board.san(move))
-        temp_board.push(move)
+    try:
+        for move in pv:
+            pv_san.append(board.san(move))
+            board.push(move)
+    finally:
+        for _ in pv_san:
+            board.pop()
 
     return EvaluationResult(
         centipawns=centipawns,
@@ -3,17 +3,32 @@
 from __future__ import annotations
 
 import io
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import chess
 import chess.pgn
 
+from ..utils.parser import parse_game_string_simple
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Hashable, Sequence
+
+# Game termination markers that may end a bare move sequence
+_RESULT_TOKENS = frozenset({"1-0", "0-1", "1/2-1/2", "*"})
+
+# Parsed moves keyed by (position, SAN); see _san_to_move
+_SAN_CACHE: dict[tuple[Hashable, str], chess.Move] = {}
+_SAN_CACHE_MAXSIZE = 65536
+
+# Bits of PositionInfo.flags
+FLAG_CAPTURE = 1
+FLAG_CASTLING = 2
+FLAG_EN_PASSANT = 4
+FLAG_GIVES_CHECK = 8
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveInfo:
     """Information about a legal move."""
 
@@ -36,9 +51,14 @@ class MoveInfo:
     """Whether this move puts the opponent in check."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionInfo:
-    """Information about a chess position and its legal moves."""
+    """Information about a chess position and its legal moves.
+
+    Moves are stored as parallel sequences (``sans``, ``ucis``, ``flags``)
+    indexed by move number; ``legal_moves`` builds MoveInfo objects from
+    them on first access.
+    """
 
     fen: str
     """FEN string representing the position."""
@@ -55,13 +75,50 @@ class PositionInfo:
     is_stalemate: bool
     """Whether the position is stalemate."""
 
-    legal_moves: tuple[MoveInfo, ...]
-    """All legal moves in this position."""
+    sans: tuple[str, ...]
+    """SAN of each legal move."""
+
+    ucis: tuple[str, ...]
+    """UCI notation of each legal move."""
+
+    flags: bytes
+    """FLAG_* bits of each legal move (e.g. ``flags[i] & FLAG_CAPTURE``)."""
+
+    san_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    """The SANs as a set, for membership tests (``"O-O" in info.san_set``)."""
+
+    _legal_moves: tuple[MoveInfo, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "san_set", frozenset(self.sans))
+
+    @property
+    def legal_moves(self) -> tuple[MoveInfo, ...]:
+        """All legal moves in this position."""
+        legal_moves = self._legal_moves
+        if legal_moves is None:
+            legal_moves = tuple(self.move_info(i) for i in range(len(self.sans)))
+            object.__setattr__(self, "_legal_moves", legal_moves)
+        return legal_moves
 
     @property
     def move_count(self) -> int:
         """Number of legal moves available."""
-        return len(self.legal_moves)
+        return len(self.sans)
+
+    def move_info(self, index: int) -> MoveInfo:
+        """Return the MoveInfo for the legal move at index."""
+        flags = self.flags[index]
+        return MoveInfo(
+            san=self.sans[index],
+            uci=self.ucis[index],
+            is_capture=bool(flags & FLAG_CAPTURE),
+            is_castling=bool(flags & FLAG_CASTLING),
+            is_en_passant=bool(flags & FLAG_EN_PASSANT),
+            gives_check=bool(flags & FLAG_GIVES_CHECK),
+        )
 
 
 def get_legal_moves(board: chess.Board) -> PositionInfo:
@@ -81,26 +138,36 @@ def get_legal_moves(board: chess.Board) -> PositionInfo:
         >>> info.move_count
         20
     """
-    legal_moves = []
-    for move in board.legal_moves:
-        legal_moves.append(
-            MoveInfo(
-                san=board.san(move),
-                uci=move.uci(),
-                is_capture=board.is_capture(move),
-                is_castling=board.is_castling(move),
-                is_en_passant=board.is_en_passant(move),
-                gives_check=board.gives_check(move),
-            )
+    sans = []
+    ucis = []
+    flags = bytearray()
+    for move in board.generate_legal_moves():
+        # san() already plays the move to decide on a check suffix, so reuse
+        # that instead of calling gives_check() (another push/pop)
+        san = board.san(move)
+        sans.append(san)
+        ucis.append(move.uci())
+        flags.append(
+            (FLAG_CAPTURE if board.is_capture(move) else 0)
+            | (FLAG_CASTLING if board.is_castling(move) else 0)
+            | (FLAG_EN_PASSANT if board.is_en_passant(move) else 0)
+            | (FLAG_GIVES_CHECK if san.endswith(("+", "#")) else 0)
         )
 
+    # Mate and stalemate follow from the moves already generated; calling
+    # is_checkmate()/is_stalemate() would generate them twice more
+    is_check = board.is_check()
+    no_moves = not sans
+
     return PositionInfo(
         fen=board.fen(),
         turn="white" if board.turn == chess.WHITE else "black",
-        is_check=board.is_check(),
-        is_checkmate=board.is_checkmate(),
-        is_stalemate=board.is_stalemate(),
-        legal_moves=tuple(legal_moves),
+        is_check=is_check,
+        is_checkmate=is_check and no_moves,
+        is_stalemate=not is_check and no_moves,
+        sans=tuple(sans),
+        ucis=tuple(ucis),
+        flags=bytes(flags),
     )
 
 
@@ -123,7 +190,7 @@ def get_legal_moves_from_pgn(pgn: str) -> PositionInfo:
         >>> info = get_legal_moves_from_pgn("1. e4 e5 2. Nf3 Nc6")
         >>> info.turn
         'white'
-        >>> any(m.san == "Bb5" for m in info.legal_moves)
+        >>> "Bb5" in info.sans
         True
     """
     board = _parse_pgn_to_board(pgn)
@@ -164,8 +231,12 @@ def _parse_pgn_to_board(pgn: str) -> chess.Board:
     """
     pgn = pgn.strip()
 
-    # If it doesn't look like full PGN (no headers), wrap it
+    # If it doesn't look like full PGN (no headers), try pushing the moves
+    # directly before falling back to the full PGN parser
     if not pgn.startswith("["):
+        board = _push_bare_moves(pgn)
+        if board is not None:
+            return board
         pgn = f'[Result "*"]\n\n{pgn} *'
 
     game = chess.pgn.read_game(io.StringIO(pgn))
@@ -178,3 +249,43 @@ def _parse_pgn_to_board(pgn: str) -> chess.Board:
         board.push(move)
 
     return board
+
+
+def _push_bare_moves(pgn: str) -> chess.Board | None:
+    """
+    Play a bare move sequence (e.g. "1. e4 e5 2. Nf3") on a new board.
+
+    Returns None if the text contains anything other than move numbers,
+    SAN moves and a game result, so the caller can use the PGN parser instead.
+    """
+    board = chess.Board()
+    # Empty tokens are never produced, so no move is read as a wildcard and
+    # "*" is skipped along with the other results
+    for token in parse_game_string_simple(s=pgn, wildcard_symbol=""):
+        if token is None or token in _RESULT_TOKENS:
+            continue
+        try:
+            board.push_san(token)
+        except ValueError:
+            return None
+    return board
+
+
+def _san_to_move(board: chess.Board, san: str) -> chess.Move:
+    """
+    Parse a SAN move in the given position, memoizing the result.
+
+    The cache is keyed by the board's transposition key, which is much
+    cheaper to compute than a FEN/EPD string.
+
+    Raises:
+        ValueError: If the SAN is invalid, illegal or ambiguous.
+    """
+    key = (board._transposition_key(), san)
+    move = _SAN_CACHE.get(key)
+    if move is None:
+        move = board.parse_san(san)
+        if len(_SAN_CACHE) >= _SAN_CACHE_MAXSIZE:
+            _SAN_CACHE.clear()
+        _SAN_CACHE[key] = move
+    return move
@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ..chess_tools.evaluation import evaluate_fen, EvaluationResult
+import chess
+import chess.engine
+
+from ..chess_tools.evaluation import (
+    _evaluate_board_core,
+    _parse_single_result,
+    _resolve_stockfish_path,
+    evaluate_fen,
+    EvaluationResult,
+    MultiPVResult,
+    StockfishPool,
+)
+from ..chess_tools.moves import _san_to_move
+from .tree import _materialize_leaf_fens
 
 if TYPE_CHECKING:
     from .tree import MoveNode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeEvaluation:
     """Evaluation result for a single node/line."""
 
@@ -50,6 +66,8 @@ def evaluate_node(
     *,
     depth: int = 20,
     stockfish_path: str | None = None,
+    pool: StockfishPool | None = None,
+    use_cache: bool = True,
 ) -> NodeEvaluation:
     """Evaluate a single node from a move tree.
 
@@ -60,6 +78,8 @@ def evaluate_node(
         node: A MoveNode from an expanded tree (typically a leaf node).
         depth: Stockfish search depth.
         stockfish_path: Path to Stockfish binary (auto-detected if None).
+        pool: An open StockfishPool to reuse instead of spawning Stockfish.
+        use_cache: Read and store the result in the evaluation cache.
 
     Returns:
         NodeEvaluation containing the line, position, and evaluation.
@@ -70,19 +90,16 @@ def evaluate_node(
         >>> result = evaluate_node(leaf, depth=15)
         >>> print(f"{' '.join(result.line)}: {result.evaluation_str}")
     """
-    # Get the line leading to this node by walking up isn't possible
-    # with frozen dataclass, so we require the caller to track it
-    # or we extract from a single leaf
-    line = _extract_line_to_node(node)
-
     eval_result = evaluate_fen(
         node.fen,
         depth=depth,
         stockfish_path=stockfish_path,
+        pool=pool,
+        use_cache=use_cache,
     )
 
     return NodeEvaluation(
-        line=line,
+        line=node.line,
         fen=node.fen,
         centipawns=eval_result.centipawns,
         mate_in=eval_result.mate_in,
@@ -95,6 +112,8 @@ def evaluate_line(
     *,
     depth: int = 20,
     stockfish_path: str | None = None,
+    pool: StockfishPool | None = None,
+    use_cache: bool = True,
 ) -> NodeEvaluation:
     """Evaluate a position reached by a sequence of moves.
 
@@ -105,6 +124,8 @@ def evaluate_line(
         moves: Tuple of SAN moves from the starting position.
         depth: Stockfish search depth.
         stockfish_path: Path to Stockfish binary (auto-detected if None).
+        pool: An open StockfishPool to reuse instead of spawning Stockfish.
+        use_cache: Read and store the result in the evaluation cache.
 
     Returns:
         NodeEvaluation containing the line, position, and evaluation.
@@ -113,17 +134,16 @@ def evaluate_line(
         >>> result = evaluate_line(("e4", "e5", "Nf3"), depth=15)
         >>> print(f"{result.evaluation_str}")
     """
-    import chess
-
     board = chess.Board()
     for move_san in moves:
-        move = board.parse_san(move_san)
-        board.push(move)
+        board.push(_san_to_move(board, move_san))
 
-    eval_result = evaluate_fen(
-        board.fen(),
+    eval_result = _evaluate_board_core(
+        board,
         depth=depth,
         stockfish_path=stockfish_path,
+        pool=pool,
+        use_cache=use_cache,
     )
 
     return NodeEvaluation(
@@ -135,12 +155,304 @@ def evaluate_line(
     )
 
 
-def _extract_line_to_node(node: MoveNode) -> tuple[str, ...]:
-    """Extract the move sequence for a single-line tree branch.
+def evaluate_children(
+    node: MoveNode,
+    *,
+    depth: int = 20,
+    stockfish_path: str | None = None,
+    pool: StockfishPool | None = None,
+) -> list[NodeEvaluation]:
+    """Evaluate all children of a node with a single MultiPV search.
+
+    Searches the parent position once, with one principal variation per
+    child move, instead of searching every child position separately;
+    Stockfish shares its hash table and move ordering between the siblings.
+    Each child's evaluation is read from the line that starts with its move,
+    so it corresponds to a search of about depth - 1 from the child position.
+
+    Args:
+        node: A MoveNode whose children should be evaluated.
+        depth: Stockfish search depth for the parent position.
+        stockfish_path: Path to Stockfish binary (auto-detected if None).
+        pool: An open StockfishPool to reuse instead of spawning Stockfish.
+
+    Returns:
+        One NodeEvaluation per child, in the same order as node.children.
+
+    Example:
+        >>> tree = expand_wildcards("1. e4 __")
+        >>> replies = evaluate_children(tree.children[0], depth=15)
+        >>> best = min(replies, key=lambda r: r.centipawns or 0)
+    """
+    if not node.children:
+        return []
+
+    if pool is None:
+        with StockfishPool(stockfish_path) as own_pool:
+            return evaluate_children(node, depth=depth, pool=own_pool)
+
+    board = chess.Board(node.fen)
+    moves = [_san_to_move(board, child.line[-1]) for child in node.children]
+
+    result = pool.analyse(board, depth=depth, multipv=len(moves), root_moves=moves)
+    lines = result.lines if isinstance(result, MultiPVResult) else (result,)
+    lines_by_move = {line.best_move_uci: line for line in lines}
+
+    evaluations = []
+    for child, move in zip(node.children, moves):
+        line = lines_by_move.get(move.uci())
+        if line is None:
+            # The engine did not report this move; search the child directly
+            evaluations.append(evaluate_node(child, depth=depth, pool=pool))
+            continue
+
+        evaluations.append(
+            NodeEvaluation(
+                line=child.line,
+                fen=child.fen,
+                centipawns=line.centipawns,
+                mate_in=_mate_after_move(line.mate_in, mover=board.turn),
+                best_move=line.principal_variation[1] if len(line.principal_variation) > 1 else "",
+            )
+        )
+    return evaluations
+
+
+def evaluate_tree(
+    tree: MoveNode,
+    *,
+    depth: int = 20,
+    workers: int | None = None,
+    stockfish_path: str | None = None,
+    hash_mb: int = 16,
+    reuse_hash: bool = True,
+    group_siblings: bool = False,
+    pool: StockfishPool | None = None,
+) -> list[NodeEvaluation]:
+    """Evaluate every leaf of a move tree using several Stockfish processes.
+
+    Leaves are independent positions, so running one single-threaded engine
+    per worker scales much better than one engine with many threads.
+    Leaves are dispatched in depth-first order, so with reuse_hash an engine
+    may find entries left by a nearby line, though siblings usually land on
+    different workers. Leaves that reach the same position by different move
+    orders are evaluated only once.
+
+    Args:
+        tree: Root of an expanded tree (see expand_wildcards).
+        depth: Stockfish search depth.
+        workers: Number of concurrent Stockfish processes. Defaults to half
+            the CPU count. Ignored if pool is given.
+        stockfish_path: Path to Stockfish binary (auto-detected if None).
+        hash_mb: Hash table size in MB for each Stockfish process. The small
+            default keeps the total modest when many workers run at once.
+        reuse_hash: Keep each engine's hash table between leaves instead of
+            clearing it with ``ucinewgame`` (see StockfishPool). Ignored if
+            pool is given.
+        group_siblings: Evaluate leaves that share a parent (e.g. all replies
+            at a trailing wildcard) with one MultiPV search of the parent via
+            evaluate_children, instead of one search per leaf. Their scores
+            then correspond to about depth - 1 from the leaf position.
+        pool: An open StockfishPool to use. Its worker count sets the
+            concurrency.
+
+    Returns:
+        One NodeEvaluation per leaf, in the same order as tree.flatten().
+
+    Example:
+        >>> tree = expand_wildcards("1. e4 __")
+        >>> results = evaluate_tree(tree, depth=12, workers=4)
+        >>> best = max(results, key=lambda r: r.centipawns or 0)
+    """
+    if pool is None:
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 1) // 2)
+        with StockfishPool(
+            stockfish_path,
+            workers=workers,
+            threads=1,
+            hash_mb=hash_mb,
+            reuse_hash=reuse_hash,
+        ) as own_pool:
+            return evaluate_tree(tree, depth=depth, group_siblings=group_siblings, pool=own_pool)
+
+    _materialize_leaf_fens(tree)
+    leaves = tree.leaves()
+
+    # Leaves searched together through their parent, keyed by id(leaf)
+    parents = _sibling_parents(tree) if group_siblings else {}
+
+    # Evaluate each distinct position once; transpositions share the result
+    fens_by_epd: dict[str, str] = {}
+    parents_by_epd: dict[str, MoveNode] = {}
+    for _, node in leaves:
+        parent = parents.get(id(node))
+        if parent is None:
+            fens_by_epd.setdefault(node.epd, node.fen)
+        else:
+            parents_by_epd.setdefault(parent.epd, parent)
+
+    with ThreadPoolExecutor(max_workers=pool.workers) as executor:
+        eval_results = executor.map(
+            lambda fen: evaluate_fen(fen, depth=depth, pool=pool),
+            fens_by_epd.values(),
+        )
+        sibling_results = executor.map(
+            lambda parent: evaluate_children(parent, depth=depth, pool=pool),
+            parents_by_epd.values(),
+        )
+        results_by_epd: dict[str, EvaluationResult] = {}
+        for epd, result in zip(fens_by_epd, eval_results):
+            # Searched with multipv=1, so every result is a single line
+            assert isinstance(result, EvaluationResult)
+            results_by_epd[epd] = result
+        children_by_epd = {
+            epd: {child.line[-1]: child for child in children}
+            for epd, children in zip(parents_by_epd, sibling_results)
+        }
+
+    evaluations = []
+    for line, node in leaves:
+        parent = parents.get(id(node))
+        eval_result: EvaluationResult | NodeEvaluation
+        if parent is None:
+            eval_result = results_by_epd[node.epd]
+        else:
+            eval_result = children_by_epd[parent.epd][line[-1]]
+        evaluations.append(
+            NodeEvaluation(
+                line=line,
+                fen=node.fen,
+                centipawns=eval_result.centipawns,
+                mate_in=eval_result.mate_in,
+                best_move=eval_result.best_move,
+            )
+        )
+    return evaluations
+
+
+async def evaluate_tree_async(
+    tree: MoveNode,
+    *,
+    depth: int = 20,
+    concurrency: int = 4,
+    stockfish_path: str | None = None,
+    hash_mb: int = 16,
+    reuse_hash: bool = True,
+) -> list[NodeEvaluation]:
+    """Evaluate every leaf of a move tree from an asyncio event loop.
+
+    Async counterpart of evaluate_tree for callers that already run an event
+    loop: starts ``concurrency`` single-threaded Stockfish processes with
+    python-chess's async engine API and keeps all of them busy, deduplicating
+    transposed leaves the same way. Results are not read from or written to
+    the evaluation cache.
+
+    Args:
+        tree: Root of an expanded tree (see expand_wildcards).
+        depth: Stockfish search depth.
+        concurrency: Number of concurrent Stockfish processes.
+        stockfish_path: Path to Stockfish binary (auto-detected if None).
+        hash_mb: Hash table size in MB for each Stockfish process. The small
+            default keeps the total modest when many engines run at once.
+        reuse_hash: Keep each engine's hash table between leaves instead of
+            clearing it with ``ucinewgame``, as evaluate_tree does.
 
-    This only works reliably for leaf nodes or single-child paths.
-    For nodes with multiple children, only returns the node's own move.
+    Returns:
+        One NodeEvaluation per leaf, in the same order as tree.flatten().
+
+    Raises:
+        Exception: The first error raised by any search, after every other
+            search has finished and the engines have been shut down.
+
+    Example:
+        >>> tree = expand_wildcards("1. e4 __")
+        >>> results = asyncio.run(evaluate_tree_async(tree, depth=12))
+    """
+    stockfish_path = _resolve_stockfish_path(stockfish_path)
+
+    _materialize_leaf_fens(tree)
+    leaves = tree.leaves()
+
+    fens_by_epd: dict[str, str] = {}
+    for _, node in leaves:
+        fens_by_epd.setdefault(node.epd, node.fen)
+
+    # python-chess sends ucinewgame whenever the game object changes
+    shared_game = object()
+
+    engines: list[chess.engine.Protocol] = []
+    idle: asyncio.Queue[chess.engine.Protocol] = asyncio.Queue()
+    try:
+        for _ in range(concurrency):
+            _, engine = await chess.engine.popen_uci(stockfish_path)
+            engines.append(engine)
+            await engine.configure({"Threads": 1, "Hash": hash_mb})
+            idle.put_nowait(engine)
+
+        async def evaluate_one(fen: str) -> EvaluationResult:
+            engine = await idle.get()
+            try:
+                board = chess.Board(fen)
+                game = shared_game if reuse_hash else object()
+                info = await engine.analyse(board, chess.engine.Limit(depth=depth), game=game)
+                return _parse_single_result(board, info)
+            finally:
+                idle.put_nowait(engine)
+
+        # Wait for every search, so no engine is quit mid-search and no task
+        # exception goes unretrieved, then re-raise the first failure
+        outcomes = await asyncio.gather(
+            *(evaluate_one(fen) for fen in fens_by_epd.values()), return_exceptions=True
+        )
+        results_by_epd: dict[str, EvaluationResult] = {}
+        for epd, outcome in zip(fens_by_epd, outcomes):
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results_by_epd[epd] = outcome
+    finally:
+        for running in engines:
+            await running.quit()
+
+    evaluations = []
+    for line, node in leaves:
+        eval_result = results_by_epd[node.epd]
+        evaluations.append(
+            NodeEvaluation(
+                line=line,
+                fen=node.fen,
+                centipawns=eval_result.centipawns,
+                mate_in=eval_result.mate_in,
+                best_move=eval_result.best_move,
+            )
+        )
+    return evaluations
+
+
+def _sibling_parents(tree: MoveNode) -> dict[int, MoveNode]:
+    """Map id(leaf) to its parent for parents with several children, all leaves."""
+    parents = {}
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if len(node.children) > 1 and not any(child.children for child in node.children):
+            for child in node.children:
+                parents[id(child)] = node
+        else:
+            stack.extend(node.children)
+    return parents
+
+
+def _mate_after_move(mate_in: int | None, *, mover: chess.Color) -> int | None:
+    """Convert a mate score of a position to the score after its first move.
+
+    Mate counts are in moves of the side that delivers mate, so they only
+    shrink by one when the side that just moved is the one giving mate.
     """
-    if node.move is None:
-        return ()
-    return (node.move,)
+    if mate_in is None:
+        return None
+    if mover == chess.WHITE and mate_in > 0:
+        return mate_in - 1
+    if mover == chess.BLACK and mate_in < 0:
+        return mate_in + 1
+    return mate_in
@@ -1,5 +1,11 @@
+import re
+import sys
 from typing import Any
 
+# Move numbers ("1.", "12...") are matched but not captured; any other
+# whitespace-delimited token is captured in group 1
+_MOVE_RE = re.compile(r"\d+\.(?:\.\.)?|(\S+)")
+
 def parse_game_string_simple(*, s: str, wildcard_symbol: str) -> list[str | None]:
     """ Converts PGN-with-wildcards strings to move lists in order of ply
 
@@ -14,10 +20,10 @@ def parse_game_string_simple(*, s: str, wildcard_symbol: str) -> list[str | None
     ["e4", "e5", None, "d5", None, "h3"]
 
     """
-    tokens = s.split()
-    moves = []
-    for token in tokens:
-        if token.endswith('.') and token[:-1].isdigit():
-            continue
-        moves.append(None if token == wildcard_symbol else token)
-    return moves
\ No newline at end of file
+    # findall returns group 1, which is empty for move numbers. Moves are
+    # interned since the same few SAN strings are compared and hashed often.
+    return [
+        None if token == wildcard_symbol else sys.intern(token)
+        for token in _MOVE_RE.findall(s)
+        if token
+    ]
\ No newline at end of file
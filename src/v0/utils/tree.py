@@ -2,30 +2,68 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass, field
 
 import chess
 
+from ..chess_tools.moves import _san_to_move
 from .parser import parse_game_string_simple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class MoveNode:
     """A node in the opening tree.
 
     Represents a position reached after a move, with all possible continuations
     as children. The root node has move=None.
+
+    The FEN is not stored during expansion; it is computed from ``line`` the
+    first time it is read, since most interior nodes never need it.
+
+    Nodes compare and hash by identity so that hashing a node never walks
+    its subtree.
     """
 
     move: str | None
     """SAN move that led to this position (None for root)."""
 
-    fen: str
-    """FEN string of the position after this move."""
-
     children: tuple[MoveNode, ...]
     """Child nodes representing possible continuations."""
 
+    line: tuple[str, ...]
+    """SAN moves from the starting position to this node (empty for root)."""
+
+    _fen: str | None = field(default=None, init=False, repr=False, compare=False)
+    _line_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Children are built first, so the count is summed bottom-up once
+        object.__setattr__(
+            self, "_line_count", sum(child._line_count for child in self.children) or 1
+        )
+
+    @property
+    def fen(self) -> str:
+        """FEN string of the position after this move."""
+        fen = self._fen
+        if fen is None:
+            board = chess.Board()
+            for san in self.line:
+                board.push(_san_to_move(board, san))
+            fen = board.fen()
+            object.__setattr__(self, "_fen", fen)
+        return fen
+
+    @property
+    def epd(self) -> str:
+        """Position after this move without the halfmove/fullmove clocks.
+
+        Equal for all move orders that reach the same position.
+        """
+        return " ".join(self.fen.split()[:4])
+
     def flatten(self) -> list[tuple[str, ...]]:
         """Return all complete lines as tuples of SAN moves.
 
@@ -41,33 +79,62 @@ class MoveNode:
             >>> ("e4", "e5") in lines
             True
         """
-        return self._flatten_recursive(prefix=())
+        return list(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[tuple[str, ...]]:
+        """Yield complete lines lazily, in the same order as flatten().
+
+        Prefer this over flatten() for membership tests or when only some
+        lines are needed, since no list of all lines is built.
+
+        Yields:
+            Tuples of SAN moves, one per leaf.
+
+        Example:
+            >>> ("e4", "d5") in expand_wildcards("1. e4 __").iter_lines()
+            True
+        """
+        for node in self._iter_leaves():
+            yield node.line
+
+    def leaves(self) -> list[tuple[tuple[str, ...], MoveNode]]:
+        """Return every leaf node paired with the line leading to it.
 
-    def _flatten_recursive(self, prefix: tuple[str, ...]) -> list[tuple[str, ...]]:
-        """Recursively collect all lines from this node."""
-        # Build current path (skip None moves, i.e., root)
-        current = prefix + (self.move,) if self.move else prefix
+        Lines are in the same order as flatten().
 
-        # If leaf node, return this line
-        if not self.children:
-            return [current] if current else [()]
+        Returns:
+            List of (line, leaf) tuples.
 
-        # Otherwise, collect all lines from children
-        lines = []
-        for child in self.children:
-            lines.extend(child._flatten_recursive(current))
-        return lines
+        Example:
+            >>> tree = expand_wildcards("1. e4 e5")
+            >>> line, leaf = tree.leaves()[0]
+            >>> line, leaf.move
+            (('e4', 'e5'), 'e5')
+        """
+        return [(node.line, node) for node in self._iter_leaves()]
+
+    def _iter_leaves(self) -> Iterator[MoveNode]:
+        """Yield leaf nodes in depth-first order."""
+        # Iterative walk; children are pushed in reverse so they are
+        # visited in their original order
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.children:
+                stack.extend(reversed(node.children))
+            else:
+                yield node
 
     @property
     def line_count(self) -> int:
         """Total number of leaf positions (complete lines).
 
+        Computed from the children's counts when the node is created.
+
         Returns:
             Number of distinct lines in the tree.
         """
-        if not self.children:
-            return 1
-        return sum(child.line_count for child in self.children)
+        return self._line_count
 
 
 def expand_wildcards(
@@ -100,17 +167,65 @@ def expand_wildcards(
 
     return MoveNode(
         move=None,
-        fen=board.fen(),
-        children=_expand_moves(board, moves),
+        children=_expand_moves(board, moves, line=(), legal_cache={}),
+        line=(),
     )
 
 
-def _expand_moves(board: chess.Board, moves: list[str | None]) -> tuple[MoveNode, ...]:
+def _materialize_leaf_fens(node: MoveNode) -> None:
+    """Compute and cache the FEN of every leaf below node.
+
+    Walks the tree with a single board (push/pop per edge) rather than
+    replaying each leaf's line on a fresh board.
+
+    Args:
+        node: Subtree root.
+    """
+    board = chess.Board()
+    for san in node.line:
+        board.push(_san_to_move(board, san))
+
+    # Iterative walk; a None entry below each child undoes its move once
+    # the child's subtree has been visited
+    stack: list[MoveNode | None] = [node]
+    while stack:
+        current = stack.pop()
+        if current is None:
+            board.pop()
+            continue
+        if current is not node:
+            board.push(_san_to_move(board, current.line[-1]))
+        if current.children:
+            for child in reversed(current.children):
+                stack.append(None)
+                stack.append(child)
+        elif current._fen is None:
+            object.__setattr__(current, "_fen", board.fen())
+
+
+def _expand_moves(
+    board: chess.Board,
+    moves: list[str | None],
+    line: tuple[str, ...],
+    legal_cache: dict[Hashable, tuple[tuple[chess.Move, str], ...]],
+) -> tuple[MoveNode, ...]:
     """Recursively expand moves into a tree.
 
+    The board is mutated while exploring each branch (push/pop) and is
+    restored to its original position before returning.
+
+    Subtrees themselves cannot be shared between transpositions, since each
+    node records the line that reached it, but the legal moves and their SAN
+    are: they depend only on the position (pieces, side to move, castling
+    rights and en passant square), which is exactly what the transposition
+    key captures.
+
     Args:
         board: Current board position.
         moves: Remaining moves to process (None = wildcard).
+        line: SAN moves leading to the current board position.
+        legal_cache: Legal (move, SAN) pairs of wildcard positions already
+            expanded, keyed by transposition key.
 
     Returns:
         Tuple of MoveNodes for the next level of the tree.
@@ -121,24 +236,23 @@ def _expand_moves(board: chess.Board, moves: list[str | None]) -> tuple[MoveNode
     current_move, *remaining = moves
 
     if current_move is None:
-        # Wildcard: branch into all legal moves
-        children = []
-        for legal_move in board.legal_moves:
-            san = board.san(legal_move)
-            new_board = board.copy()
-            new_board.push(legal_move)
-            children.append(
-                MoveNode(
-                    move=san,
-                    fen=new_board.fen(),
-                    children=_expand_moves(new_board, remaining),
-                )
+        # Wildcard: branch into all legal moves. They are listed up front
+        # because the board changes while each child is expanded.
+        key = board._transposition_key()
+        legal_moves = legal_cache.get(key)
+        if legal_moves is None:
+            legal_moves = tuple(
+                (move, sys.intern(board.san(move))) for move in board.generate_legal_moves()
             )
-        return tuple(children)
+            legal_cache[key] = legal_moves
+        return tuple(
+            _expand_child(board, legal_move, san, remaining, line, legal_cache)
+            for legal_move, san in legal_moves
+        )
     else:
         # Specific move: single branch
         try:
-            move = board.parse_san(current_move)
+            move = _san_to_move(board, current_move)
         except ValueError as e:
             raise ValueError(
                 f"Illegal move '{current_move}' in position: {board.fen()}\n"
@@ -146,12 +260,32 @@ def _expand_moves(board: chess.Board, moves: list[str | None]) -> tuple[MoveNode
                 f"repertoire move becomes illegal after certain opponent responses."
             ) from e
 
-        new_board = board.copy()
-        new_board.push(move)
-        return (
-            MoveNode(
-                move=current_move,
-                fen=new_board.fen(),
-                children=_expand_moves(new_board, remaining),
-            ),
-        )
+        return (_expand_child(board, move, current_move, remaining, line, legal_cache),)
+
+
+def _expand_child(
+    board: chess.Board,
+    move: chess.Move,
+    san: str,
+    moves: list[str | None],
+    line: tuple[str, ...],
+    legal_cache: dict[Hashable, tuple[tuple[chess.Move, str], ...]],
+) -> MoveNode:
+    """Build the node reached by playing move, with its subtree.
+
+    Args:
+        board: Position before the move (restored before returning).
+        move: Move to play.
+        san: SAN of the move, stored on the node.
+        moves: Remaining moves to process after this one.
+        line: SAN moves leading to the current board position.
+        legal_cache: See _expand_moves.
+
+    Returns:
+        The MoveNode for the position after the move.
+    """
+    child_line = line + (san,)
+    board.push(move)
+    children = _expand_moves(board, moves, child_line, legal_cache)
+    board.pop()
+    return MoveNode(move=san, children=children, line=child_line)
@@ -0,0 +1,57 @@
+"""Shared pytest fixtures."""
+
+import pytest
+import chess
+
+from src.v0.chess_tools.evaluation import clear_eval_cache, find_stockfish, StockfishPool
+
+
+@pytest.fixture(autouse=True)
+def fresh_eval_cache():
+    """Start every test with an empty evaluation cache.
+
+    Otherwise a result cached by an earlier test could answer a later one
+    without that test's engine ever being asked.
+    """
+    clear_eval_cache()
+
+
+@pytest.fixture(scope="session")
+def sf_pool():
+    """A single Stockfish process shared by every test in the session.
+
+    Spawning Stockfish and loading its network costs far more than the
+    shallow searches the tests run, so the process is started once. It is
+    tuned for shallow searches: a 1 MB hash and, on Stockfish versions that
+    still offer the option, NNUE disabled. Use sf_pool_nnue for assertions
+    that depend on exact evaluations.
+
+    Under pytest-xdist (``pytest -n auto``) each worker is its own process
+    and gets its own single-threaded engine, so workers never compete for
+    one engine's threads or hash table.
+    """
+    if find_stockfish() is None:
+        pytest.skip("Stockfish not installed")
+
+    with StockfishPool(threads=1, hash_mb=1, options={"Use NNUE": False}) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="session")
+def sf_pool_nnue():
+    """A shared Stockfish process with the default evaluation and hash size."""
+    if find_stockfish() is None:
+        pytest.skip("Stockfish not installed")
+
+    with StockfishPool(threads=1) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def starting_board():
+    """A board at the starting position, built once per test module.
+
+    Tests must not leave it modified; use ``starting_board.copy(stack=False)``
+    when moves need to be pushed.
+    """
+    return chess.Board()
@@ -1,9 +1,18 @@
 """Tests for single node/line evaluation."""
 
+import asyncio
+
 import pytest
 
-from src.v0.chess_tools.evaluation import find_stockfish
-from src.v0.utils.eval_node import evaluate_node, evaluate_line, NodeEvaluation
+from src.v0.chess_tools.evaluation import find_stockfish, StockfishPool
+from src.v0.utils.eval_node import (
+    evaluate_children,
+    evaluate_line,
+    evaluate_node,
+    evaluate_tree,
+    evaluate_tree_async,
+    NodeEvaluation,
+)
 from src.v0.utils.tree import expand_wildcards
 
 
@@ -72,6 +81,15 @@ class TestEvaluateLine:
         # Should be like "+0.25" or "-0.10"
         assert eval_str[0] in "+-0" or eval_str.startswith("M")
 
+    def test_accepts_pool(self):
+        """Lines evaluated on a shared pool should match the line's position."""
+        with StockfishPool() as pool:
+            first = evaluate_line(("e4",), depth=8, pool=pool)
+            second = evaluate_line(("d4",), depth=8, pool=pool)
+
+        assert "4P3" in first.fen
+        assert "3P4" in second.fen
+
 
 class TestEvaluateNode:
     """Tests for evaluate_node function."""
@@ -85,6 +103,7 @@ class TestEvaluateNode:
 
         assert isinstance(result, NodeEvaluation)
         assert result.fen == leaf.fen
+        assert result.line == ("e4", "e5")
 
     def test_node_evaluation_has_centipawns(self):
         """Evaluation should include centipawns for non-mate positions."""
@@ -96,6 +115,95 @@ class TestEvaluateNode:
         assert result.centipawns is not None
 
 
+class TestEvaluateChildren:
+    """Tests for evaluate_children function."""
+
+    def test_evaluates_every_child_in_order(self):
+        """Should return one evaluation per child, matching its line and FEN."""
+        tree = expand_wildcards("1. e4 __")
+        e4_node = tree.children[0]
+
+        results = evaluate_children(e4_node, depth=8)
+
+        assert [r.line for r in results] == [child.line for child in e4_node.children]
+        assert [r.fen for r in results] == [child.fen for child in e4_node.children]
+
+    def test_mating_move_has_mate_zero(self):
+        """A child that delivers mate should be reported as already mated.
+
+        Position: Scholar's Mate setup after 1. e4 e5 2. Bc4 Nc6 3. Qh5 Nf6.
+        """
+        tree = expand_wildcards("1. e4 e5 2. Bc4 Nc6 3. Qh5 Nf6 4. __")
+        parent = tree.children[0].children[0].children[0].children[0].children[0].children[0]
+
+        results = {r.line[-1]: r for r in evaluate_children(parent, depth=8)}
+
+        assert results["Qxf7#"].mate_in == 0
+
+
+class TestEvaluateTree:
+    """Tests for evaluate_tree function."""
+
+    def test_evaluates_every_leaf_in_order(self):
+        """Should return one evaluation per line, in flatten() order."""
+        tree = expand_wildcards("1. e4 __")
+
+        results = evaluate_tree(tree, depth=6, workers=2)
+
+        assert [r.line for r in results] == tree.flatten()
+        assert all(isinstance(r, NodeEvaluation) for r in results)
+
+    def test_without_hash_reuse(self):
+        """Clearing the hash between leaves should still evaluate every line."""
+        tree = expand_wildcards("1. d4 __")
+
+        results = evaluate_tree(tree, depth=6, workers=2, reuse_hash=False)
+
+        assert [r.line for r in results] == tree.flatten()
+
+    def test_transpositions_share_evaluation(self):
+        """Lines reaching the same position should get the same evaluation."""
+        tree = expand_wildcards("1. __ Nf6 2. __")
+
+        results = {r.line: r for r in evaluate_tree(tree, depth=4, workers=2)}
+
+        nf3_first = results[("Nf3", "Nf6", "d4")]
+        d4_first = results[("d4", "Nf6", "Nf3")]
+        assert nf3_first.centipawns == d4_first.centipawns
+        assert nf3_first.best_move == d4_first.best_move
+
+    def test_group_siblings(self):
+        """Grouping leaves under their parent should still cover every line."""
+        tree = expand_wildcards("1. e4 e5 2. __")
+
+        results = evaluate_tree(tree, depth=8, workers=2, group_siblings=True)
+
+        assert [r.line for r in results] == tree.flatten()
+        assert all(r.fen for r in results)
+
+    def test_fen_matches_leaf(self):
+        """Each evaluation should carry the FEN of its leaf node."""
+        tree = expand_wildcards("1. d4 d5")
+
+        results = evaluate_tree(tree, depth=6, workers=1)
+
+        assert len(results) == 1
+        assert results[0].fen == tree.children[0].children[0].fen
+
+
+class TestEvaluateTreeAsync:
+    """Tests for evaluate_tree_async function."""
+
+    def test_evaluates_every_leaf_in_order(self):
+        """Should return one evaluation per line, in flatten() order."""
+        tree = expand_wildcards("1. c4 __")
+
+        results = asyncio.run(evaluate_tree_async(tree, depth=6, concurrency=2))
+
+        assert [r.line for r in results] == tree.flatten()
+        assert [r.fen for r in results] == [node.fen for _, node in tree.leaves()]
+
+
 class TestNodeEvaluationDataclass:
     """Tests for NodeEvaluation dataclass properties."""
 
@@ -2,24 +2,42 @@
 
 import pytest
 import chess
+import chess.engine
 
 from src.v0.chess_tools.evaluation import (
+    clear_eval_cache,
     evaluate_position,
     evaluate_fen,
     evaluate_pgn,
+    evaluate_positions,
     find_stockfish,
+    invalidate_stockfish_cache,
+    StockfishPool,
     EvaluationResult,
     MultiPVResult,
 )
 
 
-# Skip all tests in this module if Stockfish is not available
-pytestmark = pytest.mark.skipif(
+# Skip engine-backed test classes if Stockfish is not available
+requires_stockfish = pytest.mark.skipif(
     find_stockfish() is None,
     reason="Stockfish not installed",
 )
 
 
+@pytest.fixture(scope="class")
+def starting_analysis(sf_pool, starting_board):
+    """Single-line analysis of the starting position, shared within a test class."""
+    return evaluate_position(starting_board, depth=10, pool=sf_pool)
+
+
+@pytest.fixture(scope="class")
+def starting_multipv3(sf_pool, starting_board):
+    """Three-line analysis of the starting position, shared within a test class."""
+    return evaluate_position(starting_board, depth=10, multipv=3, pool=sf_pool)
+
+
+@requires_stockfish
 class TestFindStockfish:
     """Tests for Stockfish binary detection."""
 
@@ -30,24 +48,31 @@ class TestFindStockfish:
         assert path is not None
         assert isinstance(path, str)
 
+    def test_invalidate_stockfish_cache(self):
+        """Invalidating the cache should search again and find the same binary."""
+        path = find_stockfish()
+        invalidate_stockfish_cache()
+
+        assert find_stockfish.cache_info().currsize == 0
+        assert find_stockfish() == path
 
+
+@requires_stockfish
 class TestEvaluatePosition:
     """Tests for position evaluation with Board objects."""
 
-    def test_starting_position_is_roughly_equal(self):
+    def test_starting_position_is_roughly_equal(self, starting_analysis):
         """Starting position should evaluate close to 0."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=10)
+        result = starting_analysis
 
         assert isinstance(result, EvaluationResult)
         assert result.centipawns is not None
         # Should be within ±50 centipawns of equality
         assert -50 <= result.centipawns <= 50
 
-    def test_returns_evaluation_result(self):
+    def test_returns_evaluation_result(self, starting_analysis):
         """Should return an EvaluationResult dataclass."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=8)
+        result = starting_analysis
 
         assert isinstance(result, EvaluationResult)
         assert result.best_move != ""
@@ -55,7 +80,17 @@ class TestEvaluatePosition:
         assert len(result.principal_variation) > 0
         assert result.depth >= 8
 
-    def test_winning_position_has_positive_eval(self):
+    def test_board_is_unchanged(self, starting_board, sf_pool):
+        """Evaluating should leave the board's position and move stack intact."""
+        board = starting_board.copy(stack=False)
+        board.push_san("e4")
+        result = evaluate_position(board, depth=8, pool=sf_pool)
+
+        assert len(result.principal_variation) > 0
+        assert board.fen() == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+        assert board.move_stack == [chess.Move.from_uci("e2e4")]
+
+    def test_winning_position_has_positive_eval(self, sf_pool):
         """A winning position for White should have positive centipawns.
 
         Position: Starting position but Black's queen is missing.
@@ -64,12 +99,12 @@ class TestEvaluatePosition:
         # White is up a queen
         fen = "rnb1kbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
         board = chess.Board(fen)
-        result = evaluate_position(board, depth=10)
+        result = evaluate_position(board, depth=10, pool=sf_pool)
 
         assert result.centipawns is not None
         assert result.centipawns > 500  # At least 5 pawns advantage
 
-    def test_losing_position_has_negative_eval(self):
+    def test_losing_position_has_negative_eval(self, sf_pool):
         """A losing position for White should have negative centipawns.
 
         Position: Starting position but White's queen is missing.
@@ -78,32 +113,30 @@ class TestEvaluatePosition:
         # Black is up a queen
         fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNB1KBNR w KQkq - 0 1"
         board = chess.Board(fen)
-        result = evaluate_position(board, depth=10)
+        result = evaluate_position(board, depth=10, pool=sf_pool)
 
         assert result.centipawns is not None
         assert result.centipawns < -500
 
-    def test_evaluation_str_for_centipawns(self):
+    def test_evaluation_str_for_centipawns(self, starting_analysis):
         """evaluation_str should format centipawns correctly."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=8)
+        eval_str = starting_analysis.evaluation_str
 
-        eval_str = result.evaluation_str
         assert eval_str.startswith("+") or eval_str.startswith("-") or eval_str.startswith("0")
 
-    def test_is_mate_false_for_normal_position(self):
+    def test_is_mate_false_for_normal_position(self, starting_analysis):
         """is_mate should be False for non-mate positions."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=8)
+        result = starting_analysis
 
         assert not result.is_mate
         assert result.mate_in is None
 
 
+@requires_stockfish
 class TestMateDetection:
     """Tests for checkmate detection."""
 
-    def test_mate_in_one_detected(self):
+    def test_mate_in_one_detected(self, sf_pool):
         """Should detect mate in 1.
 
         Position: The "Scholar's Mate" setup. White has queen on h5, bishop on c4.
@@ -114,13 +147,13 @@ class TestMateDetection:
         # White to play and mate in 1 with Qf7#
         fen = "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4"
         board = chess.Board(fen)
-        result = evaluate_position(board, depth=10)
+        result = evaluate_position(board, depth=10, pool=sf_pool)
 
         assert result.is_mate
         assert result.mate_in == 1
         assert result.centipawns is None
 
-    def test_mate_evaluation_str(self):
+    def test_mate_evaluation_str(self, sf_pool):
         """evaluation_str should show mate notation.
 
         Same Scholar's Mate position as above - verifies the eval string
@@ -128,27 +161,26 @@ class TestMateDetection:
         """
         fen = "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4"
         board = chess.Board(fen)
-        result = evaluate_position(board, depth=10)
+        result = evaluate_position(board, depth=10, pool=sf_pool)
 
         assert "M" in result.evaluation_str
 
 
+@requires_stockfish
 class TestMultiPV:
     """Tests for multiple principal variation analysis."""
 
-    def test_multipv_returns_multiple_lines(self):
+    def test_multipv_returns_multiple_lines(self, starting_multipv3):
         """multipv > 1 should return multiple lines."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=8, multipv=3)
+        result = starting_multipv3
 
         assert isinstance(result, MultiPVResult)
         assert len(result.lines) == 3
         assert all(isinstance(line, EvaluationResult) for line in result.lines)
 
-    def test_multipv_lines_are_ordered(self):
+    def test_multipv_lines_are_ordered(self, starting_multipv3):
         """MultiPV lines should be ordered by evaluation."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=10, multipv=3)
+        result = starting_multipv3
 
         # First line should be best (or equal)
         evals = [
@@ -158,25 +190,23 @@ class TestMultiPV:
         # For white to move, higher is better
         assert evals[0] >= evals[-1]
 
-    def test_multipv_includes_fen(self):
+    def test_multipv_includes_fen(self, starting_multipv3):
         """MultiPVResult should include the FEN."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=8, multipv=2)
-
-        assert result.fen == board.fen()
+        assert starting_multipv3.fen == chess.STARTING_FEN
 
 
+@requires_stockfish
 class TestEvaluateFen:
     """Tests for FEN string evaluation."""
 
-    def test_evaluate_fen_works(self):
+    def test_evaluate_fen_works(self, sf_pool):
         """Should evaluate a FEN string."""
-        result = evaluate_fen(chess.STARTING_FEN, depth=8)
+        result = evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool)
 
         assert isinstance(result, EvaluationResult)
         assert result.best_move != ""
 
-    def test_evaluate_fen_custom_position(self):
+    def test_evaluate_fen_custom_position(self, sf_pool):
         """Should evaluate custom FEN positions.
 
         Position: White pawn on e4, Black pawn on c5. Non-starting position
@@ -184,32 +214,88 @@ class TestEvaluateFen:
         """
         # Sicilian Defense position
         fen = "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2"
-        result = evaluate_fen(fen, depth=10)
+        result = evaluate_fen(fen, depth=10, pool=sf_pool)
+
+        assert isinstance(result, EvaluationResult)
+
+    def test_evaluate_fen_accepts_epd(self, sf_pool):
+        """A FEN without move clocks should evaluate the same position."""
+        result = evaluate_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq -", depth=8, pool=sf_pool)
 
         assert isinstance(result, EvaluationResult)
+        assert result.best_move != ""
+
+    def test_transposition_is_cached(self, sf_pool):
+        """The same position with different move clocks should hit the cache.
+
+        Position: after 1. Nf3 Nf6 2. Ng1 Ng8, the starting position is
+        reached again with different halfmove/fullmove clocks.
+        """
+        first = evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool)
+        transposed = evaluate_fen(
+            "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 4 3", depth=8, pool=sf_pool
+        )
+
+        assert transposed is first
+
+    def test_deeper_cached_result_serves_shallower_request(self, sf_pool):
+        """A cached deep search should satisfy a shallower request, not vice versa."""
+        deep = evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool)
+
+        assert evaluate_fen(chess.STARTING_FEN, depth=6, pool=sf_pool) is deep
+        assert evaluate_fen(chess.STARTING_FEN, depth=10, pool=sf_pool) is not deep
+
+    def test_cached_multipv_reports_requested_fen(self, sf_pool):
+        """A MultiPV result served from a transposition should carry the caller's FEN."""
+        evaluate_fen(chess.STARTING_FEN, depth=8, multipv=2, pool=sf_pool)
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 4 3"
+
+        assert evaluate_fen(fen, depth=8, multipv=2, pool=sf_pool).fen == fen
+
+    def test_cache_is_per_engine_configuration(self, sf_pool):
+        """A result from one engine setup should not be reused by another."""
+        first = evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool)
+        with StockfishPool(hash_mb=2) as other_pool:
+            second = evaluate_fen(chess.STARTING_FEN, depth=8, pool=other_pool)
 
+        assert second is not first
 
+    def test_use_cache_false_bypasses_cache(self, sf_pool):
+        """use_cache=False should always search instead of reusing a cached result."""
+        first = evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool)
+
+        assert evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool, use_cache=False) is not first
+
+    def test_clear_eval_cache(self, sf_pool):
+        """Clearing the cache should force a fresh evaluation."""
+        first = evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool)
+        clear_eval_cache()
+
+        assert evaluate_fen(chess.STARTING_FEN, depth=8, pool=sf_pool) is not first
+
+
+@requires_stockfish
 class TestEvaluatePgn:
     """Tests for PGN evaluation."""
 
-    def test_evaluate_pgn_bare_moves(self):
+    def test_evaluate_pgn_bare_moves(self, sf_pool):
         """Should evaluate bare move sequences."""
-        result = evaluate_pgn("1. e4 e5", depth=8)
+        result = evaluate_pgn("1. e4 e5", depth=8, pool=sf_pool)
 
         assert isinstance(result, EvaluationResult)
         assert result.best_move != ""
 
-    def test_evaluate_pgn_full_pgn(self):
+    def test_evaluate_pgn_full_pgn(self, sf_pool):
         """Should evaluate full PGN with headers."""
         pgn = """[Event "Test"]
 [Result "*"]
 
 1. e4 e5 2. Nf3 Nc6 *"""
-        result = evaluate_pgn(pgn, depth=8)
+        result = evaluate_pgn(pgn, depth=8, pool=sf_pool)
 
         assert isinstance(result, EvaluationResult)
 
-    def test_evaluate_pgn_returns_final_position_eval(self):
+    def test_evaluate_pgn_returns_final_position_eval(self, sf_pool_nnue):
         """Should evaluate the final position, not intermediate ones.
 
         Position after 1. h4 e5 2. a3: White has made two useless pawn moves
@@ -218,7 +304,7 @@ class TestEvaluatePgn:
         central control and development potential.
         """
         # After 1. h4 e5 2. a3 - White has wasted two tempi
-        result = evaluate_pgn("1. h4 e5 2.a3", depth=12)
+        result = evaluate_pgn("1. h4 e5 2.a3", depth=12, pool=sf_pool_nnue)
         expected_result: int = -113
         tolerance: float = 2.5
 
@@ -227,34 +313,102 @@ class TestEvaluatePgn:
         assert abs(result.centipawns - expected_result) < tolerance
 
 
+@requires_stockfish
 class TestEngineConfiguration:
     """Tests for engine configuration options."""
 
-    def test_depth_parameter_respected(self):
-        """Higher depth should generally not give worse results."""
-        board = chess.Board()
+    def test_depth_parameter_respected(self, starting_board, sf_pool):
+        """Higher depth should generally not give worse results.
+
+        Iterative deepening reports every depth on the way to the limit, so
+        a single streamed depth-15 search provides both the shallow and the
+        deep result.
+        """
+        with (
+            sf_pool.borrow() as engine,
+            engine.analysis(starting_board, chess.engine.Limit(depth=15)) as analysis,
+        ):
+            depths = [info["depth"] for info in analysis if "depth" in info]
+
+        assert 5 in depths
+        assert depths[-1] >= 15
+        # The wrapper must pass depth through to the engine
+        assert evaluate_position(starting_board, depth=5, pool=sf_pool).depth == 5
+
+    def test_nodes_limit_is_reproducible(self, starting_board, sf_pool):
+        """A single-threaded node-limited search should give the same result every time."""
+        board = starting_board
 
-        result_low = evaluate_position(board, depth=5)
-        result_high = evaluate_position(board, depth=15)
+        first = evaluate_position(board, nodes=20_000, pool=sf_pool)
+        second = evaluate_position(board, nodes=20_000, pool=sf_pool)
 
-        assert result_high.depth >= result_low.depth
+        assert first == second
 
-    def test_custom_stockfish_path(self):
+    def test_custom_stockfish_path(self, starting_board):
         """Should accept custom Stockfish path."""
         path = find_stockfish()
-        board = chess.Board()
+        board = starting_board
 
         result = evaluate_position(board, depth=8, stockfish_path=path)
 
         assert isinstance(result, EvaluationResult)
 
 
+@requires_stockfish
+class TestStockfishPool:
+    """Tests for reusing Stockfish processes across evaluations."""
+
+    def test_pool_evaluates_multiple_positions(self):
+        """A single pool should serve several evaluations."""
+        with StockfishPool() as pool:
+            first = evaluate_position(chess.Board(), depth=8, pool=pool)
+            second = evaluate_fen(chess.STARTING_FEN, depth=8, pool=pool)
+
+        assert isinstance(first, EvaluationResult)
+        assert isinstance(second, EvaluationResult)
+
+    def test_evaluate_positions_preserves_order(self):
+        """evaluate_positions should yield one result per board, in order.
+
+        White is up a queen in the first position and down a queen in the second.
+        """
+        boards = [
+            chess.Board("rnb1kbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"),
+            chess.Board("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNB1KBNR w KQkq - 0 1"),
+        ]
+        results = list(evaluate_positions(boards, depth=8))
+
+        assert len(results) == 2
+        assert results[0].centipawns > 500
+        assert results[1].centipawns < -500
+
+    def test_unsupported_options_are_skipped(self, starting_board):
+        """Options the engine does not advertise should be ignored, not rejected."""
+        with StockfishPool(hash_mb=1, options={"No Such Option": 1}) as pool:
+            result = evaluate_position(starting_board, depth=4, pool=pool)
+
+        assert isinstance(result, EvaluationResult)
+
+    def test_closed_pool_raises_error(self):
+        """Analysing on a pool that was never opened should raise RuntimeError."""
+        with pytest.raises(RuntimeError):
+            StockfishPool().analyse(chess.Board(), depth=8)
+
+    def test_borrowed_engine_is_returned(self, sf_pool, starting_board):
+        """An engine borrowed from the pool should be usable by the pool afterwards."""
+        with sf_pool.borrow() as engine:
+            assert isinstance(engine, chess.engine.SimpleEngine)
+
+        assert isinstance(sf_pool.analyse(starting_board, depth=4), EvaluationResult)
+
+
+@requires_stockfish
 class TestErrorHandling:
     """Tests for error conditions."""
 
-    def test_invalid_stockfish_path_raises_error(self):
+    def test_invalid_stockfish_path_raises_error(self, starting_board):
         """Invalid Stockfish path should raise FileNotFoundError."""
-        board = chess.Board()
+        board = starting_board
 
         with pytest.raises(FileNotFoundError):
             evaluate_position(board, stockfish_path="/nonexistent/path/stockfish")
@@ -265,16 +419,21 @@ class TestDataclassProperties:
 
     def test_evaluation_result_is_frozen(self):
         """EvaluationResult should be immutable."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=8)
+        result = EvaluationResult(
+            centipawns=0,
+            mate_in=None,
+            best_move="e4",
+            best_move_uci="e2e4",
+            principal_variation=("e4",),
+            depth=1,
+        )
 
         with pytest.raises(AttributeError):
             result.centipawns = 100
 
     def test_multipv_result_is_frozen(self):
         """MultiPVResult should be immutable."""
-        board = chess.Board()
-        result = evaluate_position(board, depth=8, multipv=2)
+        result = MultiPVResult(lines=(), fen=chess.STARTING_FEN)
 
         with pytest.raises(AttributeError):
             result.fen = "different"
@@ -7,6 +7,10 @@ from src.v0.chess_tools.moves import (
     get_legal_moves,
     get_legal_moves_from_pgn,
     get_legal_moves_from_fen,
+    FLAG_CAPTURE,
+    FLAG_CASTLING,
+    FLAG_EN_PASSANT,
+    FLAG_GIVES_CHECK,
     MoveInfo,
     PositionInfo,
 )
@@ -15,9 +19,9 @@ from src.v0.chess_tools.moves import (
 class TestGetLegalMoves:
     """Tests for get_legal_moves with Board objects."""
 
-    def test_starting_position_has_20_moves(self):
+    def test_starting_position_has_20_moves(self, starting_board):
         """Starting position should have exactly 20 legal moves."""
-        board = chess.Board()
+        board = starting_board
         info = get_legal_moves(board)
 
         assert info.move_count == 20
@@ -26,18 +30,18 @@ class TestGetLegalMoves:
         assert not info.is_checkmate
         assert not info.is_stalemate
 
-    def test_returns_position_info_dataclass(self):
+    def test_returns_position_info_dataclass(self, starting_board):
         """Should return a PositionInfo dataclass."""
-        board = chess.Board()
+        board = starting_board
         info = get_legal_moves(board)
 
         assert isinstance(info, PositionInfo)
         assert isinstance(info.legal_moves, tuple)
         assert all(isinstance(m, MoveInfo) for m in info.legal_moves)
 
-    def test_move_info_contains_all_fields(self):
+    def test_move_info_contains_all_fields(self, starting_board):
         """MoveInfo should contain all expected fields."""
-        board = chess.Board()
+        board = starting_board
         info = get_legal_moves(board)
 
         move = info.legal_moves[0]
@@ -48,9 +52,9 @@ class TestGetLegalMoves:
         assert hasattr(move, "is_en_passant")
         assert hasattr(move, "gives_check")
 
-    def test_fen_is_correct(self):
+    def test_fen_is_correct(self, starting_board):
         """FEN should match the board state."""
-        board = chess.Board()
+        board = starting_board
         info = get_legal_moves(board)
 
         assert info.fen == chess.STARTING_FEN
@@ -86,8 +90,7 @@ class TestGetLegalMovesFromPgn:
 
         assert info.turn == "black"
         # Black should be able to play Bc5 (Giuoco Piano)
-        move_sans = [m.san for m in info.legal_moves]
-        assert "Bc5" in move_sans
+        assert "Bc5" in info.san_set
 
     def test_users_example_position(self):
         """Test position with a knight capture on e5.
@@ -100,8 +103,20 @@ class TestGetLegalMovesFromPgn:
         assert info.turn == "black"
         assert info.move_count > 0
         # Common responses include Nxe4, d6, Qe7
-        move_sans = [m.san for m in info.legal_moves]
-        assert "d6" in move_sans  # Most common response
+        assert "d6" in info.san_set  # Most common response
+
+    def test_bare_moves_with_result_marker(self):
+        """A trailing game result should be ignored in bare move sequences."""
+        info = get_legal_moves_from_pgn("1. e4 e5 2. Nf3 *")
+
+        assert info.turn == "black"
+
+    def test_bare_moves_with_comment(self):
+        """Bare move sequences with comments should still parse."""
+        info = get_legal_moves_from_pgn("1. e4 {King's pawn} e5 2. Nf3")
+
+        assert info.turn == "black"
+        assert "Nc6" in info.san_set
 
     def test_empty_pgn_returns_starting_position(self):
         """Empty PGN should return the starting position."""
@@ -154,12 +169,10 @@ class TestEdgeCases:
         info = get_legal_moves_from_pgn("1. e4 d5 2. e5 f5")
 
         assert info.turn == "white"
-        move_sans = [m.san for m in info.legal_moves]
-        assert "exf6" in move_sans
+        assert "exf6" in info.san_set
 
         # Find the en passant move and verify its flag
-        ep_move = next(m for m in info.legal_moves if m.san == "exf6")
-        assert ep_move.is_en_passant
+        assert info.flags[info.sans.index("exf6")] & FLAG_EN_PASSANT
 
     def test_castling_available(self):
         """Castling should be included when legal.
@@ -170,11 +183,9 @@ class TestEdgeCases:
         # Position where white can castle kingside
         info = get_legal_moves_from_pgn("1. e4 e5 2. Nf3 Nc6 3. Bc4 Bc5 4. d3 Nf6 5. Bg5 d6")
 
-        move_sans = [m.san for m in info.legal_moves]
-        assert "O-O" in move_sans
+        assert "O-O" in info.san_set
 
-        castle_move = next(m for m in info.legal_moves if m.san == "O-O")
-        assert castle_move.is_castling
+        assert info.flags[info.sans.index("O-O")] & FLAG_CASTLING
 
     def test_castling_blocked_by_check(self):
         """Castling should not be available when in check.
@@ -187,9 +198,8 @@ class TestEdgeCases:
         fen = "r3k2r/pppppppp/8/8/4q3/8/PPPP1PPP/R3K2R w KQkq - 0 1"
         info = get_legal_moves_from_fen(fen)
 
-        move_sans = [m.san for m in info.legal_moves]
-        assert "O-O" not in move_sans
-        assert "O-O-O" not in move_sans
+        assert "O-O" not in info.san_set
+        assert "O-O-O" not in info.san_set
         assert info.is_check
 
     def test_pinned_piece_cannot_move(self):
@@ -247,9 +257,8 @@ class TestEdgeCases:
         # Position where captures are possible
         info = get_legal_moves_from_pgn("1. e4 d5")
 
-        captures = [m for m in info.legal_moves if m.is_capture]
-        assert len(captures) == 1
-        assert captures[0].san == "exd5"
+        captures = [san for san, flags in zip(info.sans, info.flags) if flags & FLAG_CAPTURE]
+        assert captures == ["exd5"]
 
     def test_check_detection(self):
         """Moves giving check should be correctly identified.
@@ -262,8 +271,7 @@ class TestEdgeCases:
         fen = "rnbqkbnr/ppp2ppp/3p4/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 0 3"
         info = get_legal_moves_from_fen(fen)
 
-        check_moves = [m for m in info.legal_moves if m.gives_check]
-        check_sans = [m.san for m in check_moves]
+        check_sans = [san for san, flags in zip(info.sans, info.flags) if flags & FLAG_GIVES_CHECK]
         assert "Bb5+" in check_sans
 
 
@@ -285,6 +293,28 @@ class TestDataclassProperties:
         with pytest.raises(AttributeError):
             move.san = "different"
 
+    def test_move_info_matches_parallel_fields(self):
+        """move_info(i) should rebuild the MoveInfo from sans, ucis and flags."""
+        info = get_legal_moves_from_pgn("1. e4 d5")
+        i = info.sans.index("exd5")
+
+        assert info.move_info(i) == MoveInfo(
+            san="exd5",
+            uci="e4d5",
+            is_capture=True,
+            is_castling=False,
+            is_en_passant=False,
+            gives_check=False,
+        )
+        assert info.legal_moves[i] == info.move_info(i)
+
+    def test_san_set_matches_sans(self):
+        """san_set should contain exactly the legal SANs."""
+        info = get_legal_moves_from_pgn("1. e4 e5")
+
+        assert info.san_set == frozenset(info.sans)
+        assert len(info.san_set) == info.move_count
+
     def test_move_count_property(self):
         """move_count property should match len(legal_moves)."""
         info = get_legal_moves_from_pgn("1. e4 e5")
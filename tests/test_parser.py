@@ -14,4 +14,16 @@ def test_parse_game_string_simple():
         s="1. e4 e5 2. __ d5 3. __ h3",
         wildcard_symbol="__"
     )
-    assert w == ["e4", "e5", None, "d5", None, "h3"]
\ No newline at end of file
+    assert w == ["e4", "e5", None, "d5", None, "h3"]
+
+def test_parse_game_string_simple_move_numbers_without_spaces():
+    """
+    Move numbers glued to moves (`2.a3`) and black move numbers (`2...`)
+    should be dropped just like spaced ones
+    """
+
+    w = parse_game_string_simple(
+        s="1. h4 e5 2.a3 2... __",
+        wildcard_symbol="__"
+    )
+    assert w == ["h4", "e5", "a3", None]
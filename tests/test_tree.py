@@ -92,6 +92,27 @@ class TestMoveNode:
         expected_fen = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
         assert e4_node.fen == expected_fen
 
+    def test_line_is_path_from_root(self):
+        """Each node's line should be the SAN moves leading to it."""
+        tree = expand_wildcards("1. e4 e5 2. Nf3")
+
+        assert tree.line == ()
+        assert tree.children[0].children[0].line == ("e4", "e5")
+        assert tree.children[0].children[0].children[0].line == ("e4", "e5", "Nf3")
+
+    def test_epd_omits_clocks(self):
+        """EPD should be the FEN without halfmove/fullmove clocks."""
+        tree = expand_wildcards("1. e4")
+
+        assert tree.children[0].epd == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq -"
+
+    def test_transpositions_share_epd(self):
+        """Different move orders reaching the same position should share an EPD."""
+        tree = expand_wildcards("1. __ Nf6 2. __")
+        epds = {line: node.epd for line, node in tree.leaves()}
+
+        assert epds[("Nf3", "Nf6", "d4")] == epds[("d4", "Nf6", "Nf3")]
+
     def test_node_is_frozen(self):
         """MoveNode should be immutable."""
         tree = expand_wildcards("1. e4")
@@ -129,6 +150,41 @@ class TestFlatten:
         assert ("e4", "d5") in lines
 
 
+class TestIterLines:
+    """Tests for the iter_lines method."""
+
+    def test_iter_lines_matches_flatten(self):
+        """iter_lines should yield exactly the flattened lines, in order."""
+        tree = expand_wildcards("1. e4 __ 2. Nf3")
+
+        assert list(tree.iter_lines()) == tree.flatten()
+
+    def test_iter_lines_is_lazy(self):
+        """iter_lines should return an iterator, not a materialized list."""
+        tree = expand_wildcards("1. e4 __")
+        lines = tree.iter_lines()
+
+        assert next(lines) == tree.flatten()[0]
+
+
+class TestLeaves:
+    """Tests for the leaves method."""
+
+    def test_leaves_match_flatten(self):
+        """Leaf lines should be exactly the flattened lines."""
+        tree = expand_wildcards("1. e4 __ 2. Nf3")
+
+        assert [line for line, _ in tree.leaves()] == tree.flatten()
+
+    def test_leaves_are_leaf_nodes(self):
+        """Every returned node should be a leaf whose move ends the line."""
+        tree = expand_wildcards("1. e4 __")
+
+        for line, node in tree.leaves():
+            assert node.children == ()
+            assert node.move == line[-1]
+
+
 class TestLineCount:
     """Tests for line_count property."""
 
@@ -144,6 +200,12 @@ class TestLineCount:
 
         assert tree.line_count == 1
 
+    def test_line_count_sums_children(self):
+        """Each node's line_count should be the sum over its children."""
+        tree = expand_wildcards("1. e4 __ 2. __")
+
+        assert tree.line_count == sum(child.line_count for child in tree.children[0].children)
+
     def test_line_count_empty(self):
         """Empty tree should have count of 1 (the empty line)."""
         tree = expand_wildcards("")
@@ -176,8 +238,7 @@ class TestRealRepertoires:
 
         # 20 Black responses to e4, each followed by Nc3
         assert tree.line_count == 20
-        lines = tree.flatten()
-        assert all(line[0] == "e4" and line[2] == "Nc3" for line in lines)
+        assert all(line[0] == "e4" and line[2] == "Nc3" for line in tree.iter_lines())
 
 
 class TestEdgeCases:
@@ -209,5 +270,14 @@ class TestEdgeCases:
         # Second wildcard: 20 responses each
         # Third wildcard: varies by position
         assert tree.line_count > 0
+        assert all(len(line) == 3 for line in tree.iter_lines())
+
+    def test_transposed_wildcards_expand_identically(self):
+        """A wildcard reached by two move orders should offer the same replies."""
+        tree = expand_wildcards("1. __ Nf6 2. __ __")
         lines = tree.flatten()
-        assert all(len(line) == 3 for line in lines)
+
+        via_nf3 = {line[-1] for line in lines if line[:3] == ("Nf3", "Nf6", "d4")}
+        via_d4 = {line[-1] for line in lines if line[:3] == ("d4", "Nf6", "Nf3")}
+        assert via_nf3
+        assert via_nf3 == via_d4